@@ -1,10 +1,12 @@
 from manim import *
 import sys
 import os
+from functools import partial
 
 # Add bili_lib to path to import components
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from bili_lib.visuals.components import OSThreadBox, CPUBox, ThreadMobject, RuntimeBox, BLUE_COLOR
+from bili_lib.visuals.components import OSThreadBox, CPUBox, ThreadMobject, RuntimeBox, SwitchStatsOverlay, BLUE_COLOR
+from bili_lib.render.scene import BiliScene
 
 # --- Constants ---
 STACK_ITEM_COLOR = GREEN_C
@@ -12,7 +14,13 @@ CODE_COLOR = ORANGE
 POINTER_COLOR = RED
 
 # --- Scene Definition ---
-class CoroutineLifecycle(Scene):
+class CoroutineLifecycle(BiliScene):
+    # Long-trace mode: extra round-robin yields after Phase 5. Only the first K switches
+    # (counted over the whole scene) and flagged ones are animated, the rest fast-forward.
+    long_trace_switches = int(os.environ.get("BILI_LONG_TRACE", "0"))
+    full_switch_budget = int(os.environ.get("BILI_FULL_SWITCHES", "6"))
+    flagged_switches = set()
+
     def construct(self):
         # --- Phase 0: Setup Scene ---
         self.camera.background_color = BLACK
@@ -25,6 +33,14 @@ class CoroutineLifecycle(Scene):
         self.cpu_box = cpu_box
         self.threads = threads
 
+        # Switch bookkeeping for long-trace mode
+        self.switch_count = 0
+        self.pending_updates = {} # Deferred instant updates of fast-forwarded switches
+        self.stats_overlay = None
+        if self.long_trace_switches:
+            self.stats_overlay = SwitchStatsOverlay(threads).to_corner(DR, buff=0.3)
+            self.play(FadeIn(self.stats_overlay))
+
         # --- Phase 1: Initialization & Spawn T1 ---
         phase1_title = self._show_phase_title("Phase 1: Init & Spawn T1")
 
@@ -110,7 +126,8 @@ class CoroutineLifecycle(Scene):
             to_code_mobject=t1_code,
             switch_title_text="Context Switch: T0 -> T1",
             from_state="Ready", # T0 becomes Ready
-            to_state="Running"  # T1 becomes Running
+            to_state="Running", # T1 becomes Running
+            flagged=True
         )
 
         # Cleanup Phase 3 visuals (Keep t1_code and self.control_flow_arrow)
@@ -133,7 +150,7 @@ class CoroutineLifecycle(Scene):
         self.play(cpu_box.update_registers(t1_running_regs), run_time=0.5)
         # Highlight yield in T1's code (t1_code from Phase 3)
         yield_line_highlight = SurroundingRectangle(t1_code[-1], color=YELLOW, buff=0.05)
-        self.play(Create(yield_line_highlight))
+        self.play(self.decorative(Create(yield_line_highlight)))
         self.wait(1)
 
         # 4.2 Show yield and switch logic
@@ -161,7 +178,8 @@ class CoroutineLifecycle(Scene):
             to_code_mobject=t2_code,
             switch_title_text="Context Switch: T1 -> T2",
             from_state="Ready",
-            to_state="Running"
+            to_state="Running",
+            flagged=True
         )
 
         # Cleanup Phase 4 visuals (Keep t2_code and self.control_flow_arrow)
@@ -184,7 +202,7 @@ class CoroutineLifecycle(Scene):
         self.play(cpu_box.update_registers(t2_running_regs), run_time=0.5)
         # Highlight yield in T2's code (t2_code from Phase 4)
         yield_line_highlight_t2 = SurroundingRectangle(t2_code[-1], color=YELLOW, buff=0.05)
-        self.play(Create(yield_line_highlight_t2))
+        self.play(self.decorative(Create(yield_line_highlight_t2)))
         self.wait(1)
 
         # 5.2 Show yield and switch logic
@@ -213,18 +231,24 @@ class CoroutineLifecycle(Scene):
             to_code_mobject=t1_code_resume,
             switch_title_text="Context Switch: T2 -> T1",
             from_state="Ready",
-            to_state="Running"
+            to_state="Running",
+            flagged=True
         )
 
         # 5.6 Highlight instruction after yield in T1's resumed code
         resume_highlight = SurroundingRectangle(t1_code_resume[2], color=GREEN_C, buff=0.05) # Assuming yield is line 3 (index 2)
-        self.play(Create(resume_highlight))
+        self.play(self.decorative(Create(resume_highlight)))
         self.wait(1)
 
         # Cleanup Phase 5 visuals (Keep t1_code_resume and self.control_flow_arrow)
         self._cleanup_mobjects(yield_code, switch_code, phase5_title, resume_highlight, *switch_mobjects_p5)
         self.wait(0.5)
 
+        # Optional long run: T1 -> T2 -> T0 -> T1 ... yields, ending with T1 running again
+        if self.long_trace_switches:
+            saved_ctxs = {"0": t0_runtime_regs, "1": t1_saved_ctx, "2": t2_running_regs}
+            self._run_long_trace(saved_ctxs, t1_code_resume)
+
 
         # --- Phase 6: T1 Finishes & Enters Guard ---
         phase6_title = self._show_phase_title("Phase 6: T1 Finishes -> Guard")
@@ -391,7 +415,7 @@ class CoroutineLifecycle(Scene):
     def _show_phase_title(self, title_text):
         """Displays a phase title at the bottom edge."""
         title = Text(title_text, font_size=24, color=WHITE).to_edge(DOWN)
-        self.play(Write(title))
+        self.play(self.decorative(Write(title)))
         return title # Return the mobject for later cleanup
 
     def _cleanup_mobjects(self, *mobjects):
@@ -410,10 +434,10 @@ class CoroutineLifecycle(Scene):
             paragraph_config={"font_size": 14}
         ).next_to(self.os_thread, DOWN, buff=0.3).align_to(self.os_thread, LEFT)
         self.play(FadeIn(spawn_code))
-        self.play(Indicate(thread_to_spawn.box, color=YELLOW, scale_factor=1.1))
+        self.play(self.decorative(Indicate(thread_to_spawn.box, color=YELLOW, scale_factor=1.1)))
 
         stack_setup_title = Text(f"Setting up {thread_to_spawn.label.text} Stack", font_size=18, color=WHITE).next_to(thread_to_spawn.stack_box, UP, buff=0.2)
-        self.play(Write(stack_setup_title))
+        self.play(self.decorative(Write(stack_setup_title)))
 
         stack_top = thread_to_spawn.get_stack_top_pos()
         guard_addr = Text("G (Guard)", font_size=12, color=STACK_ITEM_COLOR).move_to(stack_top + DOWN * 0.2)
@@ -445,12 +469,87 @@ class CoroutineLifecycle(Scene):
         # Return temporary mobjects for cleanup
         return spawn_code, stack_setup_title, guard_addr, skip_addr, func_addr, rsp_pointer, rsp_pointer_label
 
-    def _context_switch(self, from_thread, to_thread, from_regs_to_save, to_regs_to_load, to_code_mobject, switch_title_text, from_state="Ready", to_state="Running"):
+    def _should_animate_switch(self, switch_number, flagged=False):
+        """Whether switch number switch_number gets the full save/load/jump sequence."""
+        if flagged or not self.long_trace_switches:
+            return True
+        return switch_number <= self.full_switch_budget or switch_number in self.flagged_switches
+
+    def _fast_forward_switch(self, from_thread, to_thread, from_regs_to_save, to_regs_to_load, from_state, to_state):
+        """Applies a context switch without animating it.
+
+        Thread states change right away (the overlay reads them), the label
+        updates are deferred to _sync_fast_forward() and only the latest one
+        per label is kept, so a run of skipped switches costs no frames and
+        a bounded number of Text rebuilds.
+        """
+        from_thread.state = from_state
+        to_thread.state = to_state
+        self.pending_updates[(from_thread.thread_id, "state")] = partial(from_thread.set_state, from_state)
+        self.pending_updates[(to_thread.thread_id, "state")] = partial(to_thread.set_state, to_state)
+        self.pending_updates[(from_thread.thread_id, "ctx")] = partial(from_thread.set_ctx, from_regs_to_save)
+        self.pending_updates[("runtime", "current")] = partial(self.runtime_box.set_current, to_thread.thread_id)
+        self.pending_updates[("cpu", "registers")] = partial(self.cpu_box.set_registers, to_regs_to_load)
+
+    def _sync_fast_forward(self):
+        """Brings the visuals up to date with any fast-forwarded switches."""
+        if not self.pending_updates:
+            return
+        for update in self.pending_updates.values():
+            update()
+        self.pending_updates.clear()
+        if self.stats_overlay is not None:
+            self.stats_overlay.refresh()
+
+    def _run_long_trace(self, saved_ctxs, resume_code_mobject):
+        """Round-robins the threads for long_trace_switches switches, rounded up to whole rounds."""
+        order = [self.threads["T1"], self.threads["T2"], self.threads["T0"]]
+        rounds = -(-self.long_trace_switches // len(order))
+        trace_title = self._show_phase_title(f"Long Run: {rounds * len(order)} Yields")
+        # T1's code sits where the resume texts go, and it's not running during the trace
+        self.play(FadeOut(resume_code_mobject))
+
+        arrow_moved = False
+        for i in range(rounds * len(order)):
+            from_thread = order[i % len(order)]
+            to_thread = order[(i + 1) % len(order)]
+            resume_text = None
+            if self._should_animate_switch(self.switch_count + 1):
+                resume_text = Text(f"T{to_thread.thread_id} resumes after yield", font_size=14, color=CODE_COLOR).next_to(to_thread, DOWN, buff=0.3)
+                arrow_moved = True
+            switch_mobjects = self._context_switch(
+                from_thread=from_thread,
+                to_thread=to_thread,
+                from_regs_to_save=saved_ctxs[from_thread.thread_id],
+                to_regs_to_load=saved_ctxs[to_thread.thread_id],
+                to_code_mobject=resume_text,
+                switch_title_text=f"Context Switch: T{from_thread.thread_id} -> T{to_thread.thread_id}"
+            )
+            if resume_text is not None:
+                self._cleanup_mobjects(resume_text, *switch_mobjects)
+
+        self._sync_fast_forward()
+        # Bring back T1's code, which Phase 6 picks up from
+        self.play(FadeIn(resume_code_mobject, shift=UP))
+        if arrow_moved:
+            self.play(Transform(self.control_flow_arrow, Arrow(start=self.cpu_box.box.get_bottom(), end=resume_code_mobject.get_top(), color=RED, stroke_width=3)))
+        self.wait(1)
+        self._cleanup_mobjects(trace_title)
+
+    def _context_switch(self, from_thread, to_thread, from_regs_to_save, to_regs_to_load, to_code_mobject, switch_title_text, from_state="Ready", to_state="Running", flagged=False):
         """Handles the animation sequence for a context switch."""
+        self.switch_count += 1
+        if self.stats_overlay is not None:
+            self.stats_overlay.record_switch(to_thread.thread_id)
+        if not self._should_animate_switch(self.switch_count, flagged):
+            self._fast_forward_switch(from_thread, to_thread, from_regs_to_save, to_regs_to_load, from_state, to_state)
+            return ()
+        self._sync_fast_forward()
+
         # Scheduling indication
-        self.play(Indicate(from_thread.box, color=GREEN))
+        self.play(self.decorative(Indicate(from_thread.box, color=GREEN)))
         self.wait(0.5)
-        self.play(Indicate(to_thread.box, color=YELLOW))
+        self.play(self.decorative(Indicate(to_thread.box, color=YELLOW)))
         self.wait(1)
 
         # State Transitions & Runtime Update
@@ -474,7 +573,7 @@ class CoroutineLifecycle(Scene):
             self.play(Transform(existing_switch_title, switch_title))
             switch_title_to_clean = existing_switch_title # Clean the transformed one
         else:
-            self.play(Write(switch_title))
+            self.play(self.decorative(Write(switch_title)))
             switch_title_to_clean = switch_title # Clean the new one
 
         # Save 'from' context
@@ -515,23 +614,27 @@ class CoroutineLifecycle(Scene):
         # Check if control_flow_arrow exists and transform, otherwise create
         if hasattr(self, 'control_flow_arrow') and self.control_flow_arrow in self.mobjects:
              self.play(
-                 Create(rip_indicator),
+                 self.decorative(Create(rip_indicator)),
                  FadeIn(to_code_mobject, shift=UP),
                  Transform(self.control_flow_arrow, new_control_flow_arrow)
              )
         else:
-             self.play(Create(rip_indicator))
+             self.play(self.decorative(Create(rip_indicator)))
              self.wait(0.5)
              self.play(FadeIn(to_code_mobject, shift=UP), Create(new_control_flow_arrow))
              self.control_flow_arrow = new_control_flow_arrow # Store the new arrow
 
         self.wait(1)
 
+        if self.stats_overlay is not None:
+            self.stats_overlay.refresh()
+
         # Return temporary mobjects for cleanup
         return switch_title_to_clean, rip_indicator # Arrows/text faded out, arrow managed via self.control_flow_arrow
 
     def _thread_finishes(self, finished_thread, next_thread_to_run, current_cpu_regs, finished_thread_code_mobject, guard_code_mobject, yield_code_mobject, switch_code_mobject, t0_saved_ctx, t1_saved_ctx, t2_saved_ctx):
         """Handles the animation sequence when a thread function returns and enters the guard."""
+        self._sync_fast_forward()
         # Conceptual 'ret'
         ret_text = Text(f"T{finished_thread.thread_id} func returns (ret)", font_size=16, color=CODE_COLOR).move_to(finished_thread_code_mobject)
         # Ensure the finished code mobject exists before trying to fade it out
@@ -558,7 +661,7 @@ class CoroutineLifecycle(Scene):
         guard_rip_regs = current_cpu_regs.copy()
         guard_rip_regs["rip"] = "0x...Guard"
 
-        self.play(Indicate(guard_addr_vis), Create(pop_arrow), Write(pop_text))
+        self.play(self.decorative(Indicate(guard_addr_vis)), Create(pop_arrow), Write(pop_text))
         self.wait(0.5)
         self.play(self.cpu_box.update_registers(guard_rip_regs))
         self.play(FadeOut(pop_arrow), FadeOut(pop_text), FadeOut(ret_text), FadeOut(guard_addr_vis)) # Also fade out other stack items if recreated
@@ -577,17 +680,17 @@ class CoroutineLifecycle(Scene):
         self.play(finished_thread.update_state("Available"))
         self.wait(1)
         guard_yield_highlight = SurroundingRectangle(guard_code_mobject[-1], color=YELLOW, buff=0.05)
-        self.play(Create(guard_yield_highlight))
+        self.play(self.decorative(Create(guard_yield_highlight)))
         self.play(FadeIn(yield_code_mobject)) # Show yield logic inside helper
         self.wait(1)
 
         # Scheduling (inside guard's yield)
-        self.play(Indicate(finished_thread.box, color=GREEN)) # Still 'current' technically
+        self.play(self.decorative(Indicate(finished_thread.box, color=GREEN))) # Still 'current' technically
         self.wait(0.5)
 
         no_ready_text = None # Initialize potential temporary mobject
         if next_thread_to_run:
-            self.play(Indicate(next_thread_to_run.box, color=YELLOW))
+            self.play(self.decorative(Indicate(next_thread_to_run.box, color=YELLOW)))
             self.wait(1)
             next_state = "Running"
             next_runtime_id = next_thread_to_run.thread_id
@@ -603,7 +706,7 @@ class CoroutineLifecycle(Scene):
             no_ready_text = Text("No other Ready threads found", font_size=16, color=RED).next_to(yield_code_mobject, DOWN)
             self.play(Write(no_ready_text))
             self.wait(1)
-            self.play(Indicate(self.threads["T0"].box, color=YELLOW)) # Indicate T0
+            self.play(self.decorative(Indicate(self.threads["T0"].box, color=YELLOW))) # Indicate T0
             self.wait(1)
             next_thread_to_run = self.threads["T0"]
             next_state = "Running" # T0 becomes running
@@ -639,7 +742,8 @@ class CoroutineLifecycle(Scene):
             to_code_mobject=resuming_code_mobject if resuming_code_mobject else self.runtime_box, # Point arrow to runtime if T0
             switch_title_text=switch_title_text,
             from_state="Available", # Guard leaves finished thread as Available
-            to_state=next_state
+            to_state=next_state,
+            flagged=True
         )
 
         # Additional animations after switch if resuming a thread
@@ -650,7 +754,7 @@ class CoroutineLifecycle(Scene):
              resume_line_index = 2 # Assuming yield is the 3rd line (index 2) in the snippet
              if len(resuming_code_mobject) > resume_line_index:
                  resume_highlight = SurroundingRectangle(resuming_code_mobject[resume_line_index], color=GREEN_C, buff=0.05)
-                 self.play(Create(resume_highlight))
+                 self.play(self.decorative(Create(resume_highlight)))
                  self.wait(1)
         else:
              # Pointing back to runtime (T0)
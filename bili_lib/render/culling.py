@@ -0,0 +1,122 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+class CullingCamera(Camera):
+    """Camera that skips vectorized mobjects which contribute no pixels.
+
+    Every capture drops family members that are fully transparent, lie
+    outside the frame, or sit completely under a later opaque axis-aligned
+    rectangle. ``drawn_count``/``culled_count`` describe the latest capture
+    only; a frame is usually the static capture plus a moving one, see
+    ``CullingRenderer`` for per-frame counts.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.drawn_count = 0
+        self.culled_count = 0
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        frame_min = self.frame_center[:2] - [self.frame_width / 2, self.frame_height / 2]
+        frame_max = self.frame_center[:2] + [self.frame_width / 2, self.frame_height / 2]
+
+        kept = []
+        occluders = []
+        # Walk back to front so occluders drawn later are known when testing earlier mobjects
+        for mob in reversed(mobjects):
+            if not isinstance(mob, VMobject):
+                kept.append(mob)
+                continue
+            if self._is_invisible(mob):
+                continue
+            margin = max(mob.stroke_width, mob.background_stroke_width) * self.cairo_line_width_multiple
+            points = mob.points[:, :2]
+            low = points.min(axis=0) - margin
+            high = points.max(axis=0) + margin
+            if np.any(high < frame_min) or np.any(low > frame_max):
+                continue
+            if any(np.all(low >= occ_low) and np.all(high <= occ_high) for occ_low, occ_high in occluders):
+                continue
+            kept.append(mob)
+            if self._is_opaque_rectangle(mob):
+                occluders.append((points.min(axis=0), points.max(axis=0)))
+        kept.reverse()
+
+        self.drawn_count = len(kept)
+        self.culled_count = len(mobjects) - len(kept)
+        return kept
+
+    @staticmethod
+    def _is_invisible(mob):
+        if len(mob.points) == 0:
+            return True
+        fill = np.any(mob.fill_rgbas[:, 3] > 0)
+        stroke = mob.stroke_width > 0 and np.any(mob.stroke_rgbas[:, 3] > 0)
+        background = mob.background_stroke_width > 0 and np.any(mob.background_stroke_rgbas[:, 3] > 0)
+        return not (fill or stroke or background)
+
+    @staticmethod
+    def _is_opaque_rectangle(mob):
+        if not isinstance(mob, Rectangle) or not np.all(mob.fill_rgbas[:, 3] >= 1):
+            return False
+        # Rotated rectangles have anchors off their bounding box edges
+        anchors = np.asarray(mob.get_anchors())[:, :2]
+        low, high = anchors.min(axis=0), anchors.max(axis=0)
+        return bool(np.all(np.isclose(anchors, low) | np.isclose(anchors, high)))
+
+
+class CullingRenderer(CairoRenderer):
+    """Cairo renderer that counts what a ``CullingCamera`` drew and culled per frame.
+
+    The static mobjects of a play are captured once into the background
+    image, and every frame then only captures the moving ones on top of it.
+    Their counts are kept apart and summed per frame into ``frame_drawn``/
+    ``frame_culled``; ``total_drawn``/``total_culled`` accumulate over the
+    written frames. Frames rasterized by the parallel pool are not counted.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_drawn = 0
+        self.static_culled = 0
+        self.frame_drawn = 0
+        self.frame_culled = 0
+        self.total_drawn = 0
+        self.total_culled = 0
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        static_image = super().save_static_frame_data(scene, static_mobjects)
+        if static_image is None:
+            self.static_drawn = self.static_culled = 0
+        else:
+            self.static_drawn = self.camera.drawn_count
+            self.static_culled = self.camera.culled_count
+        return static_image
+
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        super().update_frame(scene, mobjects, *args, **kwargs)
+        if not isinstance(self.camera, CullingCamera):
+            return
+        self.frame_drawn = self.camera.drawn_count
+        self.frame_culled = self.camera.culled_count
+        # Without explicit mobjects the whole scene was captured, static ones included
+        if mobjects and self.static_image is not None:
+            self.frame_drawn += self.static_drawn
+            self.frame_culled += self.static_culled
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        self._count_frames(1)
+
+    def freeze_current_frame(self, duration):
+        super().freeze_current_frame(duration)
+        # Same frame count as the one CairoRenderer writes
+        dt = 1 / self.camera.frame_rate
+        self._count_frames(int(duration / dt))
+
+    def _count_frames(self, num_frames):
+        if self.skip_animations:
+            return
+        self.total_drawn += self.frame_drawn * num_frames
+        self.total_culled += self.frame_culled * num_frames
+        logger.debug(f"Frame drew {self.frame_drawn} mobjects, culled {self.frame_culled}")
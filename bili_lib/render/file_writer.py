@@ -0,0 +1,76 @@
+import av
+import numpy as np
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+
+
+class StaticHoldFileWriter(SceneFileWriter):
+    """Scene file writer that encodes runs of identical frames as one held frame.
+
+    Static ``wait()`` calls already reach the writer as a single frame with
+    ``num_frames > 1``; frames of settled animations are compared against the
+    previous one. A run is encoded once at its first pts and once more at its
+    last pts, so the (variable frame rate) container keeps the full duration
+    while the encoder only sees two frames.
+
+    Holds are only written to libx264 streams, with B-frames turned off:
+    reordering across the pts gap of a held run makes the muxer report a
+    short partial duration, and the next partial then overlaps the hold
+    once the partials are concatenated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset_hold()
+
+    def _reset_hold(self):
+        self.hold_frames = False
+        self.held_frame = None
+        self.held_count = 0
+        self.next_pts = 0
+
+    def open_partial_movie_stream(self, file_path=None):
+        self._reset_hold()
+        super().open_partial_movie_stream(file_path=file_path)
+        codec_context = self.video_stream.codec_context
+        # Gif output is re-timed frame by frame when combining, so holds would be lost
+        self.hold_frames = config.format != "gif" and codec_context.name == "libx264"
+        if self.hold_frames:
+            # The codec is only opened on the first encode, so the options still apply
+            codec_context.options = {**codec_context.options, "bf": "0"}
+        # The codec context has no time base until it is opened
+        self.time_base = 1 / to_av_frame_rate(config.frame_rate)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        """Extends the held run or flushes it and starts a new one."""
+        if not self.hold_frames:
+            return super().encode_and_write_frame(frame, num_frames)
+        if self.held_frame is not None and np.array_equal(frame, self.held_frame):
+            self.held_count += num_frames
+            return
+        self._flush_held_frame()
+        self.held_frame = frame
+        self.held_count = num_frames
+
+    def listen_and_write(self):
+        super().listen_and_write()
+        # The queue is drained once the stream is closed, flush the last run
+        self._flush_held_frame()
+
+    def _flush_held_frame(self):
+        if self.held_frame is None:
+            return
+        self._encode_at(self.held_frame, self.next_pts)
+        if self.held_count > 1:
+            self._encode_at(self.held_frame, self.next_pts + self.held_count - 1)
+        self.next_pts += self.held_count
+        self.held_frame = None
+        self.held_count = 0
+
+    def _encode_at(self, frame, pts):
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        av_frame.pts = pts
+        av_frame.time_base = self.time_base
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
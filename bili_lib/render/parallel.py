@@ -0,0 +1,59 @@
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+
+# Scene snapshot inherited by the forked workers, only set while a pool is alive
+_snapshot = None
+
+
+def can_fork():
+    """Whether frame workers can be forked from the current process.
+
+    Linux only: on macOS forking after Cairo/CoreText have been initialised
+    is unsafe, which is why Python defaults to spawn there.
+    """
+    return sys.platform.startswith("linux") and (os.cpu_count() or 1) > 1
+
+
+def _render_frame(t):
+    scene, background = _snapshot
+    for animation in scene.animations:
+        animation.interpolate(t / animation.run_time)
+    camera = scene.renderer.camera
+    camera.set_frame_to_background(background)
+    camera.capture_mobjects(scene.moving_mobjects, include_submobjects=True)
+    return np.array(camera.pixel_array)
+
+
+def render_frames_in_parallel(scene, times, processes=None):
+    """Yields the frames of the current play() at ``times``, in order.
+
+    The workers are forked after the animations have begun, so each one holds
+    an exact snapshot of the scene and interpolates and rasterizes its own
+    frames from the frame time alone. ``imap`` hands the frames back in
+    submission order, ready to be streamed to the encoder.
+
+    The fork happens while the file writer's ``listen_and_write`` thread and
+    libx264's encoder threads are running. Only the forking thread survives
+    in the children, so a lock held by one of those threads at fork time
+    stays locked there. The workers never touch the writer or the encoder,
+    which is what keeps this working, but it is why the mode is opt-in.
+    """
+    global _snapshot
+    renderer = scene.renderer
+    if renderer.static_image is not None:
+        background = renderer.static_image
+    else:
+        renderer.camera.reset()
+        background = renderer.get_frame()
+    processes = processes or os.cpu_count()
+    chunksize = max(1, len(times) // (processes * 4))
+
+    _snapshot = (scene, background)
+    try:
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            yield from pool.imap(_render_frame, times, chunksize=chunksize)
+    finally:
+        _snapshot = None
@@ -0,0 +1,93 @@
+import os
+
+from manim import *
+from manim.animation.animation import prepare_animation
+
+from .culling import CullingCamera, CullingRenderer
+from .file_writer import StaticHoldFileWriter
+from .parallel import can_fork, render_frames_in_parallel
+
+
+class BiliScene(Scene):
+    """Base scene that plugs the project's render pipeline into the Cairo renderer."""
+    file_writer_class = StaticHoldFileWriter
+    # Opt-in: plays longer than this many frames are rasterized by a forked process pool
+    # (Linux only, see render_frames_in_parallel for the threading caveat)
+    parallel_frame_threshold = None
+    parallel_processes = None
+    # Draft renders scale all timings, show decorative animations instantly and use low quality
+    draft_mode = os.environ.get("BILI_DRAFT") == "1"
+    draft_time_scale = 0.1
+
+    def __init__(self, renderer=None, camera_class=CullingCamera, skip_animations=False, **kwargs):
+        if self.draft_mode:
+            config.quality = "low_quality"
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = CullingRenderer(
+                file_writer_class=self.file_writer_class,
+                camera_class=camera_class,
+                skip_animations=skip_animations,
+            )
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+
+    def play(self, *args, **kwargs):
+        if self.draft_mode:
+            # Animations dropped by decorative() arrive as None
+            args = [arg for arg in args if arg is not None]
+            if not args:
+                return
+            run_time = kwargs.pop("run_time", None)
+            args = self.compile_animations(*args)
+            for animation in args:
+                scaled = (run_time if run_time is not None else animation.run_time) * self.draft_time_scale
+                # Never shorter than one frame, which manim would warn about on every call
+                animation.run_time = max(scaled, 1 / config.frame_rate)
+        super().play(*args, **kwargs)
+
+    def decorative(self, animation):
+        """Returns ``animation``, or applies its end state instantly in draft mode.
+
+        Only meant for animations that leave the final layout unchanged:
+        introducers are added and removers removed straight away, anything
+        else (``Indicate`` and friends) is dropped.
+        """
+        if not self.draft_mode:
+            return animation
+        animation = prepare_animation(animation)
+        if animation.is_introducer():
+            self.add(animation.mobject)
+        elif animation.is_remover():
+            self.remove(animation.mobject)
+        return None
+
+    def play_internal(self, skip_rendering=False):
+        if skip_rendering or not self._should_render_in_parallel():
+            return super().play_internal(skip_rendering)
+
+        times = np.arange(0, self.duration, 1 / config.frame_rate)
+        self.time_progression = self._get_animation_time_progression(self.animations, self.duration)
+        frames = render_frames_in_parallel(self, times, processes=self.parallel_processes)
+        for frame in frames:
+            self.renderer.add_frame(frame)
+            self.time_progression.update(1)
+        self.last_t = times[-1]
+
+        for animation in self.animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.update_mobjects(0)
+        self.renderer.static_image = None
+        self.time_progression.close()
+
+    def _should_render_in_parallel(self):
+        """Whether the current play() is long enough and order-independent enough to fan out."""
+        if self.parallel_frame_threshold is None or config.renderer != RendererType.CAIRO:
+            return False
+        if self.renderer.skip_animations or self.skip_animation_preview or not can_fork():
+            return False
+        if self.duration * config.frame_rate <= self.parallel_frame_threshold:
+            return False
+        # Updaters and stop conditions depend on frames being produced in order
+        if self.stop_condition is not None or self.always_update_mobjects or self.updaters:
+            return False
+        return not any(mob.get_updaters() for mob in self.get_mobject_family_members())
@@ -0,0 +1,110 @@
+from manim import *
+
+# VMobject attributes packed into the shared buffers
+BATCHED_ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction")
+# Scalar attributes, only interpolated for submobjects where they actually change
+BATCHED_SCALAR_ATTRS = ("stroke_width", "background_stroke_width", "sheen_factor")
+# Transform methods a batched animation must not override, or the batch would bypass them
+TRANSFORM_INTERPOLATION_METHODS = ("interpolate", "interpolate_mobject", "interpolate_submobject", "get_all_families_zipped")
+
+
+class _InterpolationBatch:
+    """Contiguous start/target buffers for a set of (submobject, start, target) triples."""
+    def __init__(self, triples):
+        self.scalars = []
+        starts, targets, slots = [], [], []
+        offset = 0
+        for submobject, start, target in triples:
+            for attr in BATCHED_ARRAY_ATTRS:
+                start_value = np.asarray(getattr(start, attr), dtype=float)
+                starts.append(start_value.ravel())
+                targets.append(np.asarray(getattr(target, attr), dtype=float).ravel())
+                slots.append((submobject, attr, offset, start_value.shape))
+                offset += start_value.size
+            for attr in BATCHED_SCALAR_ATTRS:
+                if np.any(np.asarray(getattr(start, attr)) != np.asarray(getattr(target, attr))):
+                    self.scalars.append((submobject, attr, getattr(start, attr), getattr(target, attr)))
+
+        self.start = np.concatenate(starts) if starts else np.zeros(0)
+        self.target = np.concatenate(targets) if targets else np.zeros(0)
+        self.delta = self.target - self.start
+        self.values = self.start.copy()
+        # Submobjects read straight from the result buffer from now on
+        for submobject, attr, offset, shape in slots:
+            size = int(np.prod(shape))
+            setattr(submobject, attr, self.values[offset:offset + size].reshape(shape))
+
+    def interpolate(self, alpha):
+        if alpha == 1:
+            np.copyto(self.values, self.target)
+        else:
+            np.multiply(self.delta, alpha, out=self.values)
+            self.values += self.start
+        for submobject, attr, start, target in self.scalars:
+            setattr(submobject, attr, interpolate(start, target, alpha))
+
+
+class BatchedTransform(AnimationGroup):
+    """Plays a group of Transforms with one vectorized interpolation per frame.
+
+    When the group begins, the aligned start and target data of every
+    submobject is packed into contiguous buffers, so each frame costs a single
+    NumPy operation instead of one ``interpolate`` call per submobject.
+    Submobjects whose start and target topologies differ keep the per-mobject
+    path. Groups that can't share one alpha (lagged, mixed timing, curved
+    paths) behave exactly like an ``AnimationGroup``.
+    """
+    def begin(self):
+        super().begin()
+        self.batch = None
+        self.unbatched = []
+        if self._can_batch():
+            triples = []
+            for anim in self.animations:
+                for mobs in anim.get_all_families_zipped():
+                    (triples if self._same_topology(*mobs) else self.unbatched).append(mobs)
+            self.batch = _InterpolationBatch(triples)
+            # Keeps update_mobjects forwarding to the transforms
+            self.anims_begun[:] = True
+
+    def _can_batch(self):
+        if self.lag_ratio != 0:
+            return False
+        first = self.animations[0]
+        return all(
+            self._uses_transform_interpolation(anim)
+            and anim.path_func is straight_path()
+            and anim.lag_ratio == 0
+            and anim.run_time == first.run_time
+            and anim.rate_func is first.rate_func
+            and anim.reverse_rate_function == first.reverse_rate_function
+            for anim in self.animations
+        )
+
+    @staticmethod
+    def _uses_transform_interpolation(anim):
+        """Whether anim interpolates exactly like Transform (so not TransformFromCopy and the like)."""
+        return isinstance(anim, Transform) and all(
+            getattr(type(anim), name) is getattr(Transform, name) for name in TRANSFORM_INTERPOLATION_METHODS
+        )
+
+    @staticmethod
+    def _same_topology(submobject, start, target):
+        if not all(isinstance(mob, VMobject) for mob in (submobject, start, target)):
+            return False
+        return all(
+            np.shape(getattr(start, attr)) == np.shape(getattr(target, attr)) == np.shape(getattr(submobject, attr))
+            for attr in BATCHED_ARRAY_ATTRS
+        )
+
+    def interpolate(self, alpha):
+        if self.batch is None:
+            return super().interpolate(alpha)
+        first = self.animations[0]
+        group_alpha = np.clip(self.rate_func(alpha), 0, 1)
+        if first.reverse_rate_function:
+            group_alpha = 1 - group_alpha
+        sub_alpha = first.rate_func(group_alpha)
+        self.batch.interpolate(sub_alpha)
+        for submobject, start, target in self.unbatched:
+            submobject.interpolate(start, target, sub_alpha)
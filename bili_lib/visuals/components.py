@@ -1,5 +1,7 @@
 from manim import *
 
+from .animations import BatchedTransform
+
 BLUE_COLOR = BLUE_D # 使用 Manim 预设的深蓝色
 
 class OSThreadBox(VGroup):
@@ -29,10 +31,9 @@ class CPUBox(VGroup):
 
         self.add(self.box, self.label, self.registers)
 
-    def update_registers(self, reg_values: dict):
-        """Updates the text of the register labels."""
-        animations = []
-        for i, reg_text_mobject in enumerate(self.registers):
+    def _register_labels(self, reg_values: dict):
+        """Yields (current label, new label) pairs for the registers in reg_values."""
+        for reg_text_mobject in self.registers:
             reg_name = reg_text_mobject.text.split(":")[0]
             if reg_name in reg_values:
                 new_text = f"{reg_name}: {reg_values[reg_name]}"
@@ -40,8 +41,18 @@ class CPUBox(VGroup):
                 new_label = Text(new_text, font_size=reg_text_mobject.font_size, weight=BOLD)
                 new_label.move_to(reg_text_mobject)
                 new_label.align_to(reg_text_mobject, LEFT)
-                animations.append(Transform(reg_text_mobject, new_label))
-        return AnimationGroup(*animations)
+                yield reg_text_mobject, new_label
+
+    def update_registers(self, reg_values: dict):
+        """Updates the text of the register labels."""
+        animations = [Transform(label, new_label) for label, new_label in self._register_labels(reg_values)]
+        return BatchedTransform(*animations)
+
+    def set_registers(self, reg_values: dict):
+        """Updates the register labels instantly, without an animation."""
+        for label, new_label in self._register_labels(reg_values):
+            label.become(new_label)
+        return self
 
 
 class ThreadMobject(VGroup):
@@ -49,6 +60,7 @@ class ThreadMobject(VGroup):
     def __init__(self, thread_id: str, initial_state="Available", width=2.3, height=2.5, **kwargs):
         super().__init__(**kwargs)
         self.thread_id = thread_id
+        self.state = initial_state
         self.box = Rectangle(width=width, height=height, color=BLUE_COLOR, stroke_width=2)
         self.label = Text(f"Thread {thread_id}", font_size=18).next_to(self.box, UP, buff=0.1)
 
@@ -73,16 +85,24 @@ class ThreadMobject(VGroup):
 
         self.add(self.box, self.label, self.state_label, self.stack_group, self.ctx_group)
 
-    def update_state(self, new_state: str):
-        """Returns an animation to update the state label."""
+    def _state_label(self, new_state: str):
         # new_label = Text(f"State: {new_state}", font_size=self.state_label.font_size, color=YELLOW)
         new_label = Text(f"State: {new_state}", font_size=16, color=YELLOW)
-        new_label.move_to(self.state_label)
-        return Transform(self.state_label, new_label)
+        return new_label.move_to(self.state_label)
 
-    def update_ctx(self, ctx_values: dict):
-        """Returns an animation to update the context register values."""
-        animations = []
+    def update_state(self, new_state: str):
+        """Returns an animation to update the state label."""
+        self.state = new_state
+        return Transform(self.state_label, self._state_label(new_state))
+
+    def set_state(self, new_state: str):
+        """Updates the state label instantly, without an animation."""
+        self.state = new_state
+        self.state_label.become(self._state_label(new_state))
+        return self
+
+    def _ctx_labels(self, ctx_values: dict):
+        """Returns (current label, new label) pairs for the saved rsp and rip."""
         # Simplified: just update rsp and rip for now
         rsp_label = self.ctx_registers[0]
         rip_label = self.ctx_registers[1]
@@ -94,10 +114,18 @@ class ThreadMobject(VGroup):
         # new_rip_label = Text(new_rip_text, font_size=rip_label.font_size).move_to(rip_label).align_to(rip_label, LEFT)
         new_rsp_label = Text(new_rsp_text, font_size=24).move_to(rsp_label).align_to(rsp_label, LEFT)
         new_rip_label = Text(new_rip_text, font_size=24).move_to(rip_label).align_to(rip_label, LEFT)
+        return [(rsp_label, new_rsp_label), (rip_label, new_rip_label)]
+
+    def update_ctx(self, ctx_values: dict):
+        """Returns an animation to update the context register values."""
+        animations = [Transform(label, new_label) for label, new_label in self._ctx_labels(ctx_values)]
+        return BatchedTransform(*animations)
 
-        animations.append(Transform(rsp_label, new_rsp_label))
-        animations.append(Transform(rip_label, new_rip_label))
-        return AnimationGroup(*animations)
+    def set_ctx(self, ctx_values: dict):
+        """Updates the context register values instantly, without an animation."""
+        for label, new_label in self._ctx_labels(ctx_values):
+            label.become(new_label)
+        return self
 
     def get_stack_top_pos(self):
         """Returns the position near the top of the stack box."""
@@ -125,8 +153,60 @@ class RuntimeBox(VGroup):
 
         self.add(self.box, self.label, self.threads_group, self.current_label)
 
+    def _current_label(self, thread_id: str):
+        new_label = Text(f"current: T{thread_id}", font_size=self.current_label.font_size)
+        return new_label.move_to(self.current_label)
+
     def update_current(self, thread_id: str):
         """Returns an animation to update the current thread label."""
-        new_label = Text(f"current: T{thread_id}", font_size=self.current_label.font_size)
-        new_label.move_to(self.current_label)
-        return Transform(self.current_label, new_label)
+        return Transform(self.current_label, self._current_label(thread_id))
+
+    def set_current(self, thread_id: str):
+        """Updates the current thread label instantly, without an animation."""
+        self.current_label.become(self._current_label(thread_id))
+        return self
+
+
+class SwitchStatsOverlay(VGroup):
+    """Live aggregates of a scheduling trace: switches per thread, time per state, run queue."""
+    def __init__(self, threads: dict, font_size=12, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = list(threads.values())
+        self.font_size = font_size
+        self.total_switches = 0
+        self.switches = {thread.thread_id: 0 for thread in self.threads}
+        # Time is counted in switch quanta, per thread and state
+        self.ticks = {thread.thread_id: {} for thread in self.threads}
+        self.rows = self._build_rows()
+        self.add(self.rows)
+
+    def record_switch(self, to_thread_id: str, ticks=1):
+        """Accrues a quantum in every thread's current state, then counts a switch to to_thread_id.
+
+        Call it before the switch changes any thread state.
+        """
+        for thread in self.threads:
+            state_ticks = self.ticks[thread.thread_id]
+            state_ticks[thread.state] = state_ticks.get(thread.state, 0) + ticks
+        self.switches[to_thread_id] += 1
+        self.total_switches += 1
+
+    def run_queue_length(self):
+        return sum(thread.state == "Ready" for thread in self.threads)
+
+    def _build_rows(self):
+        rows = [Text(f"switches: {self.total_switches}  run queue: {self.run_queue_length()}", font_size=self.font_size, color=YELLOW)]
+        for thread in self.threads:
+            state_ticks = "  ".join(f"{state} {count}" for state, count in sorted(self.ticks[thread.thread_id].items()))
+            row_text = f"T{thread.thread_id}: {self.switches[thread.thread_id]} sw  {state_ticks}".rstrip()
+            rows.append(Text(row_text, font_size=self.font_size))
+        return VGroup(*rows).arrange(DOWN, buff=0.08, aligned_edge=LEFT)
+
+    def refresh(self):
+        """Redraws the rows in place from the current aggregates.
+
+        Rows grow to the left, the overlay sits against the right edge of the frame.
+        """
+        new_rows = self._build_rows().move_to(self.rows.get_corner(DR), aligned_edge=DR)
+        self.rows.become(new_rows)
+        return self
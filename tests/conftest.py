@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Same as the scenes: make bili_lib importable from the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
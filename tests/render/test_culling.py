@@ -0,0 +1,59 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim import *
+
+from bili_lib.render.scene import BiliScene
+
+FRAME_RATE = 15
+
+
+class _CountingScene(BiliScene):
+    def construct(self):
+        # Three visible squares and one far off-frame, all static during the play
+        self.add(VGroup(*[Square().shift(RIGHT * i) for i in range(3)], Square().shift(LEFT * 30)))
+        self.play(Dot().animate.shift(UP), run_time=1)
+        self.play_frame_counts = (self.renderer.frame_drawn, self.renderer.frame_culled)
+        self.wait(1)
+
+
+class _OccludingScene(BiliScene):
+    def construct(self):
+        # The square is fully covered by the opaque rectangle drawn after it, the circle only partly
+        self.add(Square(side_length=1), Circle(radius=2), Rectangle(width=3, height=3, fill_opacity=1))
+        self.wait(1)
+
+
+@pytest.fixture
+def small_render_config(tmp_path):
+    with tempconfig({
+        "media_dir": str(tmp_path),
+        "frame_rate": FRAME_RATE,
+        "pixel_width": 64,
+        "pixel_height": 36,
+        "write_to_movie": False,
+        "disable_caching": True,
+    }):
+        yield
+
+
+def test_counts_static_and_moving_mobjects_per_frame(small_render_config):
+    scene = _CountingScene()
+    scene.render()
+    renderer = scene.renderer
+
+    assert (renderer.static_drawn, renderer.static_culled) == (4, 1)
+    # Static squares plus the moving dot, not just the latest capture
+    assert scene.play_frame_counts == (4, 1)
+    # The frozen wait captures the whole scene once, without the static counts on top
+    assert (renderer.frame_drawn, renderer.frame_culled) == (4, 1)
+    frames = 2 * FRAME_RATE
+    assert (renderer.total_drawn, renderer.total_culled) == (4 * frames, frames)
+
+
+def test_culls_mobjects_under_an_opaque_rectangle(small_render_config):
+    scene = _OccludingScene()
+    scene.render()
+
+    assert (scene.renderer.frame_drawn, scene.renderer.frame_culled) == (2, 1)
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+av = pytest.importorskip("av")
+manim = pytest.importorskip("manim")
+
+from bili_lib.render.file_writer import StaticHoldFileWriter
+
+FRAME_RATE = 60
+
+
+def _writer(tmp_path):
+    # Skips SceneFileWriter.__init__, which sets up the whole media directory tree
+    writer = StaticHoldFileWriter.__new__(StaticHoldFileWriter)
+    writer._reset_hold()
+    writer.renderer = SimpleNamespace(num_plays=0)
+    writer.partial_movie_directory = tmp_path
+    return writer
+
+
+def _frame(value):
+    return np.full((36, 64, 4), value, dtype=np.uint8)
+
+
+def _write_partial(writer, path, runs):
+    writer.open_partial_movie_stream(file_path=str(path))
+    for value, num_frames in runs:
+        writer.write_frame(_frame(value), num_frames=num_frames)
+    writer.close_partial_movie_stream()
+
+
+def _duration(path):
+    with av.open(str(path)) as container:
+        return container.duration / av.time_base
+
+
+@pytest.fixture
+def small_movie_config():
+    with manim.tempconfig({
+        "frame_rate": FRAME_RATE,
+        "pixel_width": 64,
+        "pixel_height": 36,
+        "format": "mp4",
+        "write_to_movie": True,
+    }):
+        yield
+
+
+def test_held_run_keeps_partial_and_concat_durations(tmp_path, small_movie_config):
+    writer = _writer(tmp_path)
+    # A few changing frames, a static wait, then identical frames from a settled animation
+    held = tmp_path / "held.mp4"
+    _write_partial(writer, held, [(0, 1), (40, 1), (80, 1), (120, 180), (120, 1), (120, 1)])
+    following = tmp_path / "following.mp4"
+    _write_partial(writer, following, [(200, 60)])
+
+    assert _duration(held) == pytest.approx(185 / FRAME_RATE, abs=1 / FRAME_RATE)
+    assert _duration(following) == pytest.approx(60 / FRAME_RATE, abs=1 / FRAME_RATE)
+
+    combined = tmp_path / "combined.mp4"
+    writer.combine_files([str(held), str(following)], combined)
+    assert _duration(combined) == pytest.approx(245 / FRAME_RATE, abs=1 / FRAME_RATE)
+
+
+def test_held_run_is_encoded_as_two_frames(tmp_path, small_movie_config):
+    writer = _writer(tmp_path)
+    held = tmp_path / "held.mp4"
+    _write_partial(writer, held, [(120, 180)])
+
+    with av.open(str(held)) as container:
+        stream = container.streams.video[0]
+        packets = [packet for packet in container.demux(stream) if packet.dts is not None]
+    assert len(packets) == 2
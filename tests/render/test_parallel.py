@@ -0,0 +1,75 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+manim = pytest.importorskip("manim")
+
+from manim import *
+
+import bili_lib.render.scene
+from bili_lib.render.parallel import can_fork, render_frames_in_parallel
+from bili_lib.render.scene import BiliScene
+
+FRAME_RATE = 15
+
+
+class _RecordingScene(BiliScene):
+    def setup(self):
+        self.frames = []
+        add_frame = self.renderer.add_frame
+
+        def record(frame, num_frames=1):
+            self.frames.append((frame, num_frames))
+            add_frame(frame, num_frames)
+
+        self.renderer.add_frame = record
+
+    def construct(self):
+        # A static backdrop, with moving mobjects drawn on top of it and partly off it
+        self.add(Rectangle(width=4, height=3, fill_opacity=1, color=BLUE_D))
+        square = Square(color=YELLOW)
+        self.play(
+            Transform(square, Circle(color=RED).shift(RIGHT * 2)),
+            Rotate(Triangle(fill_opacity=0.5), PI / 3),
+            run_time=1,
+        )
+
+
+@pytest.fixture
+def small_render_config(tmp_path):
+    with tempconfig({
+        "media_dir": str(tmp_path),
+        "frame_rate": FRAME_RATE,
+        "pixel_width": 64,
+        "pixel_height": 36,
+        "write_to_movie": False,
+        "disable_caching": True,
+    }):
+        yield
+
+
+def _render(parallel_frame_threshold):
+    scene = type("Scene", (_RecordingScene,), {"parallel_frame_threshold": parallel_frame_threshold})()
+    scene.render()
+    return scene.frames
+
+
+@pytest.mark.skipif(not can_fork(), reason="frame workers are only forked on multi-core Linux")
+def test_parallel_frames_match_serial_frames(small_render_config, monkeypatch):
+    pools = []
+
+    def spy(*args, **kwargs):
+        pools.append(args)
+        return render_frames_in_parallel(*args, **kwargs)
+
+    monkeypatch.setattr(bili_lib.render.scene, "render_frames_in_parallel", spy)
+    serial = _render(None)
+    assert not pools
+    parallel = _render(0)
+    assert len(pools) == 1
+
+    assert len(parallel) == len(serial) == FRAME_RATE
+    # Otherwise matching frames would prove nothing
+    assert not np.array_equal(serial[0][0], serial[-1][0])
+    for (parallel_frame, parallel_count), (serial_frame, serial_count) in zip(parallel, serial):
+        assert parallel_count == serial_count
+        np.testing.assert_array_equal(parallel_frame, serial_frame)
@@ -0,0 +1,43 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim import *
+
+from bili_lib.visuals.animations import BatchedTransform
+
+
+def _pairs():
+    sources = [Square().shift(LEFT * i) for i in range(3)]
+    targets = [Circle(color=RED).shift(UP * i) for i in range(3)]
+    return sources, targets
+
+
+def _play_to(animation, alpha):
+    animation.begin()
+    animation.interpolate(alpha)
+    return animation
+
+
+@pytest.mark.parametrize("alpha", [0.3, 1])
+def test_batched_matches_animation_group(alpha):
+    sources, targets = _pairs()
+    expected_sources, expected_targets = _pairs()
+    batched = _play_to(BatchedTransform(*(Transform(s, t) for s, t in zip(sources, targets))), alpha)
+    _play_to(AnimationGroup(*(Transform(s, t) for s, t in zip(expected_sources, expected_targets))), alpha)
+
+    assert batched.batch is not None
+    for mobject, expected in zip(sources, expected_sources):
+        np.testing.assert_allclose(mobject.points, expected.points)
+        np.testing.assert_allclose(mobject.stroke_rgbas, expected.stroke_rgbas)
+
+
+def test_transform_subclasses_with_own_interpolation_are_not_batched():
+    sources, targets = _pairs()
+    expected_sources, expected_targets = _pairs()
+    batched = _play_to(BatchedTransform(*(TransformFromCopy(s, t) for s, t in zip(sources, targets))), 0.3)
+    _play_to(AnimationGroup(*(TransformFromCopy(s, t) for s, t in zip(expected_sources, expected_targets))), 0.3)
+
+    assert batched.batch is None
+    for mobject, expected in zip(targets, expected_targets):
+        np.testing.assert_allclose(mobject.points, expected.points)